@@ -5,42 +5,156 @@ Analysis and visualization script for behavior priority study
 Generates plots comparing emotion-modulated vs baseline strategies
 """
 
+import argparse
+import functools
+import hashlib
 import json
-import pandas as pd
-import matplotlib.pyplot as plt
-import seaborn as sns
 from pathlib import Path
 
-# Set style
-sns.set_style("whitegrid")
-plt.rcParams['figure.figsize'] = (12, 8)
+import plot_utils
+from plot_utils import mark_up_to_date, subplots, up_to_date
+
+try:
+    import orjson
+except ImportError:  # optional, falls back to the stdlib parser
+    orjson = None
+
+# Configuration
+RESULTS_DIR = Path("experiments/behavior_priority_study/results")
+DATA_FILE = RESULTS_DIR / "detailed_results.json"
+
+# Low-cardinality string columns used as group/filter keys
+CATEGORICAL_COLUMNS = ('strategy', 'scenario', 'selected_behavior', 'dominant_emotion', 'pattern')
+
+# Compact dtypes for the numeric columns (JSON decodes them as int64/float64)
+NUMERIC_DTYPES = {
+    'step': 'int16',
+    'base_priority': 'float32',
+    'final_priority': 'float32',
+    'emotional_modifier': 'float32',
+    'matches_expected': 'bool',
+}
+
+# Output resolution: summary plots by default, --hq for publication figures
+SUMMARY_DPI = 150
+PUBLICATION_DPI = 300
+
+# zlib level 1 is several times faster than the default 6 for a small size cost
+PNG_OPTIONS = {'compress_level': 1}
+
+# Plots selectable with --plots, in generation order
+PLOT_NAMES = ('distribution', 'summary', 'priority', 'heatmap', 'scenario')
+
+# Seaborn's "whitegrid" look, from matplotlib's bundled style sheet plus the
+# settings where that sheet differs from sns.set_style("whitegrid")
+WHITEGRID_OVERRIDES = {
+    'axes.linewidth': 0.8,
+    'font.sans-serif': ['Arial', 'DejaVu Sans', 'Liberation Sans', 'Bitstream Vera Sans', 'sans-serif'],
+    'xtick.bottom': False,
+    'xtick.major.size': 3.5,
+    'ytick.left': False,
+    'ytick.major.size': 3.5,
+    'legend.frameon': True,
+    'patch.edgecolor': 'w',
+    'patch.force_edgecolor': True,
+    'figure.figsize': (12, 8),
+}
+
+# matplotlib is imported on first use, so runs that skip plotting never pay
+# for it (pandas/numpy are still needed to build the report)
+
+@functools.lru_cache(maxsize=None)
+def pyplot():
+    """Import matplotlib.pyplot on first use and apply the plot style"""
+    import matplotlib.pyplot as plt
+
+    # Renamed in matplotlib 3.6
+    sheet = 'seaborn-v0_8-whitegrid'
+    if sheet not in plt.style.available:
+        sheet = 'seaborn-whitegrid'
+    plt.style.use([sheet, WHITEGRID_OVERRIDES])
+    return plt
+
+def parse_json(raw):
+    """Parse JSON bytes, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+def input_digest(raw):
+    """Hash of the raw results data and plotting code, used to key cached plots"""
+    digest = hashlib.blake2b(raw, digest_size=16)
+    for path in (Path(__file__), Path(plot_utils.__file__)):
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
 
 def load_data():
-    """Load experimental results"""
-    results_dir = Path("experiments/behavior_priority_study/results")
+    """
+    Load experimental results
 
-    # Load detailed results
-    with open(results_dir / "detailed_results.json") as f:
-        results = json.load(f)
+    Returns:
+        (df, stats, data_key) where data_key is the input_digest() of the
+        results file, read only once for both parsing and hashing
+    """
+    import pandas as pd
 
-    # Load statistics
-    with open(results_dir / "statistics.json") as f:
-        stats = json.load(f)
+    # Load detailed results
+    raw = DATA_FILE.read_bytes()
+    results = parse_json(raw)
 
     # Create DataFrame
     df = pd.DataFrame(results)
-
-    return df, stats
-
-def plot_behavior_distribution(df, output_dir):
+    for col in CATEGORICAL_COLUMNS:
+        if col in df:
+            df[col] = df[col].astype('category')
+    df = df.astype({col: dtype for col, dtype in NUMERIC_DTYPES.items() if col in df})
+
+    # Derive statistics from the same data rather than loading statistics.json
+    stats = compute_stats(df)
+
+    return df, stats, input_digest(raw)
+
+def compute_stats(df):
+    """Per-strategy statistics in the same shape as statistics.json"""
+    import numpy as np
+
+    by_strategy = df.groupby('strategy', observed=True, sort=False)
+    totals = by_strategy.size()
+
+    counts = by_strategy['selected_behavior'].value_counts()
+    counts = counts[counts > 0]
+
+    # Shannon entropy (bits), matching calculate_entropy in runner.rs
+    probs = counts.div(totals, level=0)
+    variety = -(probs * np.log2(probs)).groupby(level=0, observed=True).sum()
+
+    avg_override = by_strategy['emotional_modifier'].mean()
+    match_rate = by_strategy['matches_expected'].mean() * 100
+
+    return [
+        {
+            'strategy': strategy,
+            'total_interactions': int(totals[strategy]),
+            'behavior_counts': counts[strategy].to_dict(),
+            'avg_priority_override': float(avg_override[strategy]),
+            'variety_score': float(variety[strategy]),
+            'expected_match_rate': float(match_rate[strategy]),
+        }
+        for strategy in totals.index
+    ]
+
+def plot_behavior_distribution(df, output_dir, dpi=SUMMARY_DPI):
     """Plot behavior selection distribution by strategy"""
-    fig, axes = plt.subplots(1, 3, figsize=(18, 6))
+    plt = pyplot()
+
+    fig, axes = subplots(1, 3, figsize=(18, 6))
 
     strategies = df['strategy'].unique()
 
     for idx, strategy in enumerate(strategies):
         strategy_data = df[df['strategy'] == strategy]
         behavior_counts = strategy_data['selected_behavior'].value_counts()
+        behavior_counts = behavior_counts[behavior_counts > 0]
 
         axes[idx].bar(range(len(behavior_counts)), behavior_counts.values)
         axes[idx].set_xticks(range(len(behavior_counts)))
@@ -49,91 +163,90 @@ def plot_behavior_distribution(df, output_dir):
         axes[idx].set_ylabel('Count')
         axes[idx].set_xlabel('Behavior')
 
-    plt.tight_layout()
-    plt.savefig(output_dir / 'behavior_distribution.png', dpi=300, bbox_inches='tight')
+    plt.savefig(output_dir / 'behavior_distribution.png', dpi=dpi, pil_kwargs=PNG_OPTIONS)
     print(f"✓ Saved behavior_distribution.png")
     plt.close()
 
-def plot_variety_comparison(stats, output_dir):
-    """Plot behavior variety scores"""
+def draw_strategy_bars(ax, stats, metric, label_fmt):
+    """Bar chart of one per-strategy statistic, with value labels"""
     strategies = [s['strategy'] for s in stats]
-    variety_scores = [s['variety_score'] for s in stats]
+    values = [s[metric] for s in stats]
 
-    plt.figure(figsize=(10, 6))
-    bars = plt.bar(strategies, variety_scores, color=['#2ecc71', '#3498db', '#e74c3c'])
-    plt.ylabel('Variety Score (Shannon Entropy)', fontsize=12)
-    plt.xlabel('Strategy', fontsize=12)
-    plt.title('Behavior Variety Comparison\n(Higher = More Diverse Behavior)', fontsize=14, fontweight='bold')
-    plt.xticks([s.replace('_', ' ').title() for s in strategies])
+    bars = ax.bar(range(len(strategies)), values, color=['#2ecc71', '#3498db', '#e74c3c'])
+    ax.set_xlabel('Strategy', fontsize=12)
+    ax.set_xticks(range(len(strategies)))
+    ax.set_xticklabels([s.replace('_', ' ').title() for s in strategies])
 
     # Add value labels on bars
-    for bar in bars:
-        height = bar.get_height()
-        plt.text(bar.get_x() + bar.get_width()/2., height,
-                f'{height:.3f}',
-                ha='center', va='bottom', fontweight='bold')
-
-    plt.tight_layout()
-    plt.savefig(output_dir / 'variety_comparison.png', dpi=300, bbox_inches='tight')
-    print(f"✓ Saved variety_comparison.png")
-    plt.close()
-
-def plot_expected_match_rate(stats, output_dir):
-    """Plot how well behaviors matched expected categories"""
-    strategies = [s['strategy'] for s in stats]
-    match_rates = [s['expected_match_rate'] for s in stats]
-
-    plt.figure(figsize=(10, 6))
-    bars = plt.bar(strategies, match_rates, color=['#2ecc71', '#3498db', '#e74c3c'])
-    plt.ylabel('Match Rate (%)', fontsize=12)
-    plt.xlabel('Strategy', fontsize=12)
-    plt.title('Expected Behavior Match Rate\n(Higher = More Contextually Appropriate)', fontsize=14, fontweight='bold')
-    plt.xticks([s.replace('_', ' ').title() for s in strategies])
-    plt.ylim(0, 100)
-
-    # Add value labels
-    for bar in bars:
-        height = bar.get_height()
-        plt.text(bar.get_x() + bar.get_width()/2., height,
-                f'{height:.1f}%',
-                ha='center', va='bottom', fontweight='bold')
-
-    plt.tight_layout()
-    plt.savefig(output_dir / 'match_rate_comparison.png', dpi=300, bbox_inches='tight')
-    print(f"✓ Saved match_rate_comparison.png")
-    plt.close()
-
-def plot_priority_modulation(df, output_dir):
-    """Plot priority modulation over scenarios"""
-    emotion_mod = df[df['strategy'] == 'emotion_modulated']
+    ax.bar_label(bars, fmt=label_fmt, padding=3, fontweight='bold')
+
+def draw_variety_bars(ax, stats):
+    """Behavior variety scores per strategy"""
+    draw_strategy_bars(ax, stats, 'variety_score', '%.3f')
+    ax.set_ylabel('Variety Score (Shannon Entropy)', fontsize=12)
+    ax.set_title('Behavior Variety Comparison\n(Higher = More Diverse Behavior)', fontsize=14, fontweight='bold')
+
+def draw_match_rate_bars(ax, stats):
+    """Expected behavior match rate per strategy"""
+    draw_strategy_bars(ax, stats, 'expected_match_rate', '%.1f%%')
+    ax.set_ylabel('Match Rate (%)', fontsize=12)
+    ax.set_title('Expected Behavior Match Rate\n(Higher = More Contextually Appropriate)', fontsize=14, fontweight='bold')
+    ax.set_ylim(0, 100)
+
+def plot_summary_bars(stats, output_dir, dpi=SUMMARY_DPI):
+    """Plot variety scores and match rates side by side in one figure
+
+    Each panel is also saved on its own under its original filename.
+    """
+    plt = pyplot()
+
+    fig, (variety_ax, match_ax) = subplots(1, 2, figsize=(20, 6))
+    draw_variety_bars(variety_ax, stats)
+    draw_match_rate_bars(match_ax, stats)
+
+    fig.savefig(output_dir / 'summary_bars.png', dpi=dpi, pil_kwargs=PNG_OPTIONS)
+    print(f"✓ Saved summary_bars.png")
+
+    # Crop the already laid-out figure to each panel
+    renderer = fig.canvas.get_renderer()
+    to_inches = fig.dpi_scale_trans.inverted()
+    for ax, filename in ((variety_ax, 'variety_comparison.png'),
+                         (match_ax, 'match_rate_comparison.png')):
+        extent = ax.get_tightbbox(renderer).transformed(to_inches).padded(0.1)
+        fig.savefig(output_dir / filename, dpi=dpi, bbox_inches=extent, pil_kwargs=PNG_OPTIONS)
+        print(f"✓ Saved {filename}")
+    plt.close(fig)
+
+def plot_priority_modulation(emotion_mod, output_dir, dpi=SUMMARY_DPI):
+    """Plot priority modulation over scenarios (emotion-modulated rows only)"""
+    plt = pyplot()
 
     if emotion_mod.empty:
         print("! No emotion-modulated data found")
         return
 
-    fig, axes = plt.subplots(2, 1, figsize=(14, 10))
+    fig, axes = subplots(2, 1, figsize=(14, 10))
+
+    # One pass over the scenarios feeds both plots
+    for scenario, scenario_data in emotion_mod.groupby('scenario', observed=True, sort=False):
+        steps = scenario_data['step'].to_numpy()
 
-    # Plot 1: Base vs Final Priority
-    scenarios = emotion_mod['scenario'].unique()
-    for scenario in scenarios:
-        scenario_data = emotion_mod[emotion_mod['scenario'] == scenario]
-        axes[0].plot(scenario_data['step'], scenario_data['base_priority'],
+        # Plot 1: Base vs Final Priority
+        axes[0].plot(steps, scenario_data['base_priority'].to_numpy(),
                     'o--', alpha=0.6, label=f'{scenario} (base)')
-        axes[0].plot(scenario_data['step'], scenario_data['final_priority'],
+        axes[0].plot(steps, scenario_data['final_priority'].to_numpy(),
                     's-', alpha=0.8, label=f'{scenario} (final)')
 
+        # Plot 2: Emotional Modifier Impact
+        axes[1].plot(steps, scenario_data['emotional_modifier'].to_numpy(),
+                    'o-', alpha=0.7, label=scenario)
+
     axes[0].set_xlabel('Interaction Step', fontsize=11)
     axes[0].set_ylabel('Priority', fontsize=11)
     axes[0].set_title('Emotional Priority Modulation\nBase vs Final Priority', fontsize=13, fontweight='bold')
     axes[0].legend(bbox_to_anchor=(1.05, 1), loc='upper left', fontsize=8)
     axes[0].grid(True, alpha=0.3)
 
-    # Plot 2: Emotional Modifier Impact
-    for scenario in scenarios:
-        scenario_data = emotion_mod[emotion_mod['scenario'] == scenario]
-        axes[1].plot(scenario_data['step'], scenario_data['emotional_modifier'],
-                    'o-', alpha=0.7, label=scenario)
-
     axes[1].set_xlabel('Interaction Step', fontsize=11)
     axes[1].set_ylabel('Emotional Modifier', fontsize=11)
     axes[1].set_title('Emotional Modifier Over Time\n(Positive = Priority Boost, Negative = Priority Reduction)',
@@ -142,85 +255,99 @@ def plot_priority_modulation(df, output_dir):
     axes[1].axhline(y=0, color='k', linestyle='--', alpha=0.3)
     axes[1].grid(True, alpha=0.3)
 
-    plt.tight_layout()
-    plt.savefig(output_dir / 'priority_modulation.png', dpi=300, bbox_inches='tight')
+    plt.savefig(output_dir / 'priority_modulation.png', dpi=dpi, pil_kwargs=PNG_OPTIONS)
     print(f"✓ Saved priority_modulation.png")
     plt.close()
 
-def plot_emotion_behavior_heatmap(df, output_dir):
-    """Heatmap showing which emotions trigger which behaviors"""
-    emotion_mod = df[df['strategy'] == 'emotion_modulated']
+def plot_emotion_behavior_heatmap(emotion_mod, output_dir, dpi=SUMMARY_DPI):
+    """Heatmap showing which emotions trigger which behaviors (emotion-modulated rows only)"""
+    import numpy as np
+    import pandas as pd
+
+    plt = pyplot()
 
     if emotion_mod.empty:
         return
 
     # Create pivot table
-    pivot = emotion_mod.groupby(['dominant_emotion', 'selected_behavior']).size().unstack(fill_value=0)
+    pivot = pd.crosstab(emotion_mod['dominant_emotion'], emotion_mod['selected_behavior'])
+
+    # Plain imshow + text is much lighter than sns.heatmap for a small matrix
+    fig, ax = subplots(figsize=(12, 8))
+    counts = pivot.to_numpy()
+    im = ax.imshow(counts, cmap='YlOrRd', aspect='auto')
+    ax.set_xticks(range(pivot.shape[1]))
+    ax.set_xticklabels(pivot.columns, rotation=45, ha='right')
+    ax.set_yticks(range(pivot.shape[0]))
+    ax.set_yticklabels(pivot.index)
+    ax.grid(False)
+    fig.colorbar(im, ax=ax, label='Count')
+
+    # Annotate cells, skipping it for grids too dense to read anyway
+    if counts.size < 400:
+        threshold = (counts.max() + counts.min()) / 2
+        for (row, col), count in np.ndenumerate(counts):
+            ax.text(col, row, f'{count:d}', ha='center', va='center',
+                    color='white' if count > threshold else 'black')
 
-    plt.figure(figsize=(12, 8))
-    sns.heatmap(pivot, annot=True, fmt='d', cmap='YlOrRd', cbar_kws={'label': 'Count'})
     plt.title('Emotion-Behavior Association\n(Emotion-Modulated Strategy)', fontsize=14, fontweight='bold')
     plt.xlabel('Selected Behavior', fontsize=12)
     plt.ylabel('Dominant Emotion', fontsize=12)
-    plt.tight_layout()
-    plt.savefig(output_dir / 'emotion_behavior_heatmap.png', dpi=300, bbox_inches='tight')
+    plt.savefig(output_dir / 'emotion_behavior_heatmap.png', dpi=dpi, pil_kwargs=PNG_OPTIONS)
     print(f"✓ Saved emotion_behavior_heatmap.png")
     plt.close()
 
-def plot_scenario_comparison(df, output_dir):
+def plot_scenario_comparison(df, output_dir, dpi=SUMMARY_DPI):
     """Compare behavior selections across scenarios"""
-    fig, axes = plt.subplots(5, 1, figsize=(14, 18))
+    plt = pyplot()
 
-    scenarios = sorted(df['scenario'].unique())
-    strategies = df['strategy'].unique()
-
-    for idx, scenario in enumerate(scenarios):
-        scenario_data = df[df['scenario'] == scenario]
+    fig, axes = subplots(5, 1, figsize=(14, 18))
 
-        for strategy in strategies:
-            strategy_data = scenario_data[scenario_data['strategy'] == strategy]
-            steps = strategy_data['step'].values
-            # Encode behaviors as numbers for plotting
-            behavior_map = {b: i for i, b in enumerate(df['selected_behavior'].unique())}
-            behaviors = [behavior_map[b] for b in strategy_data['selected_behavior'].values]
+    scenarios = sorted(df['scenario'].unique())
+    scenario_idx = {s: i for i, s in enumerate(scenarios)}
 
-            axes[idx].plot(steps, behaviors, 'o-', label=strategy, alpha=0.7, markersize=8)
+    # One groupby pass instead of a boolean mask per scenario/strategy.
+    # Behaviors are plotted by their categorical codes, so no mapping is needed.
+    for (scenario, strategy), group in df.groupby(['scenario', 'strategy'], observed=True, sort=False):
+        axes[scenario_idx[scenario]].plot(group['step'].to_numpy(),
+                                          group['selected_behavior'].cat.codes.to_numpy(),
+                                          'o-', label=strategy, alpha=0.7, markersize=8)
 
+    for idx, scenario in enumerate(scenarios):
         axes[idx].set_title(f'Scenario: {scenario.replace("_", " ").title()}', fontsize=12, fontweight='bold')
         axes[idx].set_xlabel('Step')
         axes[idx].set_ylabel('Behavior')
         axes[idx].legend()
         axes[idx].grid(True, alpha=0.3)
 
-    plt.tight_layout()
-    plt.savefig(output_dir / 'scenario_comparison.png', dpi=300, bbox_inches='tight')
+    plt.savefig(output_dir / 'scenario_comparison.png', dpi=dpi, pil_kwargs=PNG_OPTIONS)
     print(f"✓ Saved scenario_comparison.png")
     plt.close()
 
 def generate_summary_report(df, stats, output_dir):
     """Generate markdown summary report"""
-    report = """# Behavior Priority Study - Results
+    parts = ["""# Behavior Priority Study - Results
 
 ## Overview
 This experiment compares emotion-modulated behavior selection against traditional approaches.
 
 ## Key Findings
 
-"""
+"""]
 
     # Add statistics comparison
     for stat in stats:
-        report += f"### {stat['strategy'].replace('_', ' ').title()}\n\n"
-        report += f"- **Variety Score**: {stat['variety_score']:.3f}\n"
-        report += f"- **Expected Match Rate**: {stat['expected_match_rate']:.1f}%\n"
-        report += f"- **Avg Priority Override**: {stat['avg_priority_override']:.2f}\n"
-        report += f"- **Total Interactions**: {stat['total_interactions']}\n\n"
+        parts.append(f"### {stat['strategy'].replace('_', ' ').title()}\n\n")
+        parts.append(f"- **Variety Score**: {stat['variety_score']:.3f}\n")
+        parts.append(f"- **Expected Match Rate**: {stat['expected_match_rate']:.1f}%\n")
+        parts.append(f"- **Avg Priority Override**: {stat['avg_priority_override']:.2f}\n")
+        parts.append(f"- **Total Interactions**: {stat['total_interactions']}\n\n")
 
-        report += "**Behavior Distribution**:\n"
+        parts.append("**Behavior Distribution**:\n")
         for behavior, count in sorted(stat['behavior_counts'].items(), key=lambda x: x[1], reverse=True):
             pct = (count / stat['total_interactions']) * 100
-            report += f"- {behavior}: {count} ({pct:.1f}%)\n"
-        report += "\n"
+            parts.append(f"- {behavior}: {count} ({pct:.1f}%)\n")
+        parts.append("\n")
 
     # Conclusions
     emotion_mod_stats = next(s for s in stats if s['strategy'] == 'emotion_modulated')
@@ -229,7 +356,7 @@ This experiment compares emotion-modulated behavior selection against traditiona
     variety_improvement = ((emotion_mod_stats['variety_score'] - fixed_stats['variety_score'])
                           / fixed_stats['variety_score'] * 100)
 
-    report += f"""## Conclusions
+    parts.append(f"""## Conclusions
 
 1. **Behavior Variety**: Emotion-modulated approach shows {variety_improvement:+.1f}% difference in variety compared to fixed priority
 2. **Context Appropriateness**: {emotion_mod_stats['expected_match_rate']:.1f}% of behaviors matched expected categories
@@ -238,35 +365,62 @@ This experiment compares emotion-modulated behavior selection against traditiona
 ## Visualizations
 
 See generated PNG files for detailed visualizations.
-"""
+""")
 
-    with open(output_dir / 'REPORT.md', 'w') as f:
-        f.write(report)
+    (output_dir / 'REPORT.md').write_text(''.join(parts))
 
     print(f"✓ Saved REPORT.md")
 
 def main():
+    parser = argparse.ArgumentParser(description="Analyze behavior priority study results")
+    parser.add_argument('--hq', action='store_true',
+                        help=f"save plots at {PUBLICATION_DPI} DPI for publication (default {SUMMARY_DPI})")
+    parser.add_argument('--force', action='store_true',
+                        help="regenerate plots even if their inputs are unchanged")
+    parser.add_argument('--plots', nargs='*', choices=PLOT_NAMES, default=list(PLOT_NAMES),
+                        metavar='PLOT',
+                        help=f"plots to generate: {', '.join(PLOT_NAMES)} (default: all; "
+                             "pass none to only write the report)")
+    args = parser.parse_args()
+    dpi = PUBLICATION_DPI if args.hq else SUMMARY_DPI
+
     print("==================================================")
     print("Analyzing Behavior Priority Study Results")
     print("==================================================\n")
 
     # Load data
     print("Loading data...")
-    df, stats = load_data()
+    df, stats, data_key = load_data()
     print(f"✓ Loaded {len(df)} interactions\n")
 
+    # Shared by the emotion-specific plots
+    emotion_mod = df[df['strategy'] == 'emotion_modulated']
+
     # Create output directory
-    output_dir = Path("experiments/behavior_priority_study/results")
+    output_dir = RESULTS_DIR
     output_dir.mkdir(parents=True, exist_ok=True)
 
-    # Generate plots
+    # Generate plots, skipping any whose inputs haven't changed
     print("Generating visualizations...")
-    plot_behavior_distribution(df, output_dir)
-    plot_variety_comparison(stats, output_dir)
-    plot_expected_match_rate(stats, output_dir)
-    plot_priority_modulation(df, output_dir)
-    plot_emotion_behavior_heatmap(df, output_dir)
-    plot_scenario_comparison(df, output_dir)
+    plots = [
+        ('distribution', ('behavior_distribution.png',), plot_behavior_distribution, df),
+        ('summary', ('summary_bars.png', 'variety_comparison.png', 'match_rate_comparison.png'),
+         plot_summary_bars, stats),
+        ('priority', ('priority_modulation.png',), plot_priority_modulation, emotion_mod),
+        ('heatmap', ('emotion_behavior_heatmap.png',), plot_emotion_behavior_heatmap, emotion_mod),
+        ('scenario', ('scenario_comparison.png',), plot_scenario_comparison, df),
+    ]
+    for name, filenames, plot, data in plots:
+        if name not in args.plots:
+            continue
+        # A plot is only skipped if every file it writes is current
+        outputs = {output_dir / filename: f"{data_key}|{filename}|{dpi}" for filename in filenames}
+        if not args.force and all(up_to_date(path, key) for path, key in outputs.items()):
+            print(f"- {', '.join(filenames)} unchanged, skipped")
+            continue
+        plot(data, output_dir, dpi=dpi)
+        for path, key in outputs.items():
+            mark_up_to_date(path, key)
 
     # Generate report
     print("\nGenerating summary report...")
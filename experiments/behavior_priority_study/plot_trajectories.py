@@ -6,18 +6,37 @@ Generates 30 emotional trajectory plots (10 patterns × 3 strategies)
 showing how emotions evolve over 30 turns for each combination.
 
 Usage:
-    python3 plot_trajectories.py
+    python3 plot_trajectories.py [--force]
 """
 
+import argparse
+import numpy as np
 import pandas as pd
+import matplotlib
+matplotlib.use("Agg")  # PNG output only, skip GUI/Cairo backends
 import matplotlib.pyplot as plt
+from matplotlib.collections import LineCollection
+from matplotlib.lines import Line2D
+import hashlib
 import os
+from multiprocessing import Pool
 from pathlib import Path
 
+import plot_utils
+from plot_utils import mark_up_to_date, subplots, up_to_date
+
 # Configuration
 RESULTS_DIR = Path("results")
 PLOTS_DIR = RESULTS_DIR / "plots"
 DATA_FILE = RESULTS_DIR / "trajectory_data.csv"
+# Typed columnar copy of DATA_FILE, rebuilt whenever the CSV is newer
+CACHE_FILE = DATA_FILE.with_suffix(".parquet")
+
+# Low-cardinality string columns used as group/filter keys
+CATEGORICAL_COLUMNS = ("strategy", "scenario", "selected_behavior", "dominant_emotion", "pattern")
+
+# zlib level 1 is several times faster than the default 6 for a small size cost
+PNG_OPTIONS = {"compress_level": 1}
 
 # Plutchik's 8 emotions
 EMOTIONS = ["joy", "trust", "fear", "surprise", "sadness", "disgust", "anger", "anticipation"]
@@ -34,48 +53,132 @@ EMOTION_COLORS = {
     "anticipation": "#00CED1",  # DarkTurquoise
 }
 
+def input_digest():
+    """
+    Hash of the trajectory data and plotting code, used to key cached plots
+
+    The CSV is identified by its size and modification time rather than its
+    contents, so a run with a fresh Parquet cache never reads it.
+    """
+    stat = DATA_FILE.stat()
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(f"{stat.st_size}:{stat.st_mtime_ns}".encode())
+    digest.update(Path(__file__).read_bytes())
+    digest.update(Path(plot_utils.__file__).read_bytes())
+    return digest.hexdigest()
+
 def load_data():
-    """Load trajectory data from CSV"""
-    print(f"Loading data from {DATA_FILE}...")
-    df = pd.read_csv(DATA_FILE)
+    """Load trajectory data, preferring the Parquet cache over the CSV"""
+    df = None
+    if CACHE_FILE.exists() and CACHE_FILE.stat().st_mtime >= DATA_FILE.stat().st_mtime:
+        try:
+            df = pd.read_parquet(CACHE_FILE, engine="pyarrow")
+            print(f"Loaded data from {CACHE_FILE}")
+        except Exception:
+            df = None  # pyarrow missing or cache unreadable, reparse the CSV
+
+    if df is None:
+        print(f"Loading data from {DATA_FILE}...")
+        df = pd.read_csv(DATA_FILE)
+        # Write to a temp file and rename so an interrupted run never
+        # leaves a truncated cache behind
+        tmp_file = CACHE_FILE.with_name(f"{CACHE_FILE.name}.{os.getpid()}.tmp")
+        try:
+            df.to_parquet(tmp_file, engine="pyarrow")
+            os.replace(tmp_file, CACHE_FILE)
+        except ImportError:
+            pass  # pyarrow not installed, keep parsing the CSV each run
+        except Exception as e:
+            print(f"Skipped caching {CACHE_FILE}: {e}")
+        finally:
+            tmp_file.unlink(missing_ok=True)
+
+    for col in CATEGORICAL_COLUMNS:
+        if col in df:
+            df[col] = df[col].astype("category")
+
     print(f"Loaded {len(df)} total interactions")
     return df
 
-def create_trajectory_plot(df, pattern, strategy, output_path):
+def load_data_grouped():
+    """
+    Load trajectory data and split it by pattern + strategy in one pass
+
+    Returns:
+        (df, groups) where groups maps (pattern, strategy) to that
+        combination's rows sorted by turn
+    """
+    df = load_data()
+    groups = {
+        key: data.sort_values("turn")
+        for key, data in df.groupby(["pattern", "strategy"], observed=True, sort=False)
+    }
+    return df, groups
+
+def emotion_curves(data):
+    """
+    Stack every emotion's curve in data into one array
+
+    Returns:
+        (emotions, colors, segments) where segments has shape
+        (len(emotions), turns, 2), or None if no emotion columns exist
+    """
+    emotions = [e for e in EMOTIONS if f"{e}_after" in data.columns]
+    if not emotions:
+        return None
+
+    turns = data["turn"].to_numpy()
+    segments = np.stack([
+        np.column_stack((turns, data[f"{e}_after"].to_numpy())) for e in emotions
+    ])
+    colors = [EMOTION_COLORS.get(e, "#000000") for e in emotions]
+    return emotions, colors, segments
+
+def create_trajectory_plot(data, pattern, strategy, output_path, ax=None):
     """
     Create a single trajectory plot showing all 8 emotions over 30 turns
 
     Args:
-        df: DataFrame with trajectory data
+        data: Rows for this pattern + strategy, sorted by turn (or None)
         pattern: Pattern name
         strategy: Strategy name
         output_path: Where to save the plot
-    """
-    # Filter data for this pattern + strategy
-    data = df[(df["pattern"] == pattern) & (df["strategy"] == strategy)].copy()
-    data = data.sort_values("turn")
+        ax: Axes to clear and draw into (a new figure is created if None)
 
-    if len(data) == 0:
+    Returns:
+        True if the plot was saved, False if there was no data for it
+    """
+    if data is None or len(data) == 0:
         print(f"WARNING: No data for {pattern} + {strategy}")
-        return
-
-    # Create figure
-    fig, ax = plt.subplots(figsize=(12, 7))
-
-    # Plot each emotion
-    for emotion in EMOTIONS:
-        col_name = f"{emotion}_after"
-        if col_name in data.columns:
-            ax.plot(
-                data["turn"],
-                data[col_name],
-                label=emotion.capitalize(),
-                color=EMOTION_COLORS.get(emotion, "#000000"),
-                linewidth=2,
-                marker='o',
-                markersize=4,
-                alpha=0.8
-            )
+        return False
+
+    # Create figure, or reuse the caller's
+    owns_figure = ax is None
+    if owns_figure:
+        fig, ax = subplots(figsize=(12, 7))
+    else:
+        fig = ax.figure
+        ax.clear()
+
+    # Plot all emotions as one line collection plus one marker scatter
+    curves = emotion_curves(data)
+    legend_handles = []
+    if curves is not None:
+        emotions, colors, segments = curves
+        ax.add_collection(LineCollection(segments, colors=colors, linewidths=2, alpha=0.8))
+        ax.scatter(
+            segments[:, :, 0].ravel(),
+            segments[:, :, 1].ravel(),
+            c=np.repeat(colors, segments.shape[1]),
+            s=4 ** 2,
+            alpha=0.8,
+            zorder=3
+        )
+        legend_handles = [
+            Line2D([], [], color=color, linewidth=2, marker='o', markersize=4,
+                   alpha=0.8, label=emotion.capitalize())
+            for emotion, color in zip(emotions, colors)
+        ]
 
     # Formatting
     ax.set_xlabel("Turn", fontsize=12, fontweight='bold')
@@ -84,41 +187,56 @@ def create_trajectory_plot(df, pattern, strategy, output_path):
     ax.set_xlim(1, 30)
     ax.set_ylim(-0.05, 1.05)
     ax.grid(True, alpha=0.3, linestyle='--')
-    ax.legend(loc='upper left', bbox_to_anchor=(1.02, 1), fontsize=10)
+    ax.legend(handles=legend_handles, loc='upper left', bbox_to_anchor=(1.02, 1), fontsize=10)
 
     # Add horizontal line at 0.5 for reference
     ax.axhline(y=0.5, color='gray', linestyle=':', linewidth=1, alpha=0.5)
 
-    plt.tight_layout()
-    plt.savefig(output_path, dpi=150, bbox_inches='tight')
-    plt.close()
+    fig.savefig(output_path, dpi=150, pil_kwargs=PNG_OPTIONS)
+    if owns_figure:
+        plt.close(fig)
+
+    return True
 
-    print(f"  ✓ Saved {output_path.name}")
+# Per-process figure reused by _render_trajectory_plot
+_worker_ax = None
 
-def generate_all_plots():
-    """Generate all 30 trajectory plots"""
+def _render_trajectory_plot(task):
+    """Pool worker: draw one trajectory plot into this process's figure"""
+    global _worker_ax
+    if _worker_ax is None:
+        _, _worker_ax = subplots(figsize=(12, 7))
+    data, pattern, strategy, output_path = task
+    return create_trajectory_plot(data, pattern, strategy, output_path, ax=_worker_ax)
+
+def _plot_pool(n_tasks):
+    """Process pool sized to the number of independent plots"""
+    return Pool(processes=max(1, min(os.cpu_count() or 1, n_tasks)))
+
+def generate_all_plots(groups=None, force=False):
+    """Generate all 30 trajectory plots from load_data_grouped() groups"""
     print("\n" + "="*60)
     print("TRAJECTORY PLOT GENERATION")
     print("="*60 + "\n")
 
     # Load data
-    df = load_data()
+    if groups is None:
+        _, groups = load_data_grouped()
 
     # Create output directory
     PLOTS_DIR.mkdir(parents=True, exist_ok=True)
     print(f"Output directory: {PLOTS_DIR}\n")
 
     # Get unique patterns and strategies
-    patterns = sorted(df["pattern"].unique())
-    strategies = sorted(df["strategy"].unique())
+    patterns = sorted({pattern for pattern, _ in groups})
+    strategies = sorted({strategy for _, strategy in groups})
 
     print(f"Found {len(patterns)} patterns and {len(strategies)} strategies")
     print(f"Generating {len(patterns) * len(strategies)} plots...\n")
 
-    # Generate plots
-    plot_count = 0
+    # Workers only receive their own pre-sorted rows
+    tasks = []
     for pattern in patterns:
-        print(f"Pattern: {pattern}")
         for strategy in strategies:
             # Clean filename
             safe_pattern = pattern.replace(" ", "_").replace("/", "_")
@@ -126,7 +244,31 @@ def generate_all_plots():
             filename = f"{safe_pattern}_{safe_strategy}.png"
             output_path = PLOTS_DIR / filename
 
-            create_trajectory_plot(df, pattern, strategy, output_path)
+            tasks.append((groups.get((pattern, strategy)), pattern, strategy, output_path))
+
+    # Only render plots whose inputs changed since they were last saved
+    data_key = input_digest()
+    pending = [task for task in tasks
+               if force or not up_to_date(task[3], f"{data_key}|{task[3].name}")]
+
+    # Render in parallel, reporting in the original order
+    rendered = {}
+    if pending:
+        with _plot_pool(len(pending)) as pool:
+            rendered = dict(zip((task[3] for task in pending),
+                                pool.map(_render_trajectory_plot, pending)))
+
+    plot_count = 0
+    remaining = iter(tasks)
+    for pattern in patterns:
+        print(f"Pattern: {pattern}")
+        for _ in strategies:
+            _, _, _, output_path = next(remaining)
+            if output_path not in rendered:
+                print(f"  - {output_path.name} unchanged, skipped")
+            elif rendered[output_path]:
+                mark_up_to_date(output_path, f"{data_key}|{output_path.name}")
+                print(f"  ✓ Saved {output_path.name}")
             plot_count += 1
         print()
 
@@ -135,63 +277,85 @@ def generate_all_plots():
     print(f"✓ Plots saved to: {PLOTS_DIR}")
     print("="*60)
 
-def generate_comparison_grid():
+def create_comparison_grid(pattern_data, strategy, output_path):
+    """
+    Create a 2x5 grid of every pattern's trajectory for one strategy
+
+    Args:
+        pattern_data: List of (pattern, rows sorted by turn or None), in grid order
+        strategy: Strategy name
+        output_path: Where to save the plot
+    """
+    fig, axes = subplots(2, 5, figsize=(24, 10))
+    fig.suptitle(f"All Patterns - {strategy.upper()}", fontsize=16, fontweight='bold')
+
+    for idx, (pattern, data) in enumerate(pattern_data):
+        row = idx // 5
+        col = idx % 5
+        ax = axes[row, col]
+
+        # Plot all emotions as one line collection
+        curves = emotion_curves(data) if data is not None else None
+        if curves is not None:
+            _, colors, segments = curves
+            ax.add_collection(LineCollection(segments, colors=colors, linewidths=1.5, alpha=0.7))
+
+        ax.set_title(pattern, fontsize=10, fontweight='bold')
+        ax.set_xlim(1, 30)
+        ax.set_ylim(0, 1)
+        ax.grid(True, alpha=0.2)
+
+        if col == 0:
+            ax.set_ylabel("Intensity", fontsize=9)
+        if row == 1:
+            ax.set_xlabel("Turn", fontsize=9)
+
+    fig.savefig(output_path, dpi=150, pil_kwargs=PNG_OPTIONS)
+    plt.close(fig)
+
+def generate_comparison_grid(groups=None, force=False):
     """
     Generate a comparison grid showing all patterns side-by-side
     for each strategy (bonus visualization)
     """
     print("\nGenerating comparison grids...")
 
-    df = load_data()
-    patterns = sorted(df["pattern"].unique())
-    strategies = sorted(df["strategy"].unique())
-
-    for strategy in strategies:
-        fig, axes = plt.subplots(2, 5, figsize=(24, 10))
-        fig.suptitle(f"All Patterns - {strategy.upper()}", fontsize=16, fontweight='bold')
-
-        for idx, pattern in enumerate(patterns):
-            row = idx // 5
-            col = idx % 5
-            ax = axes[row, col]
-
-            # Filter data
-            data = df[(df["pattern"] == pattern) & (df["strategy"] == strategy)].copy()
-            data = data.sort_values("turn")
-
-            # Plot emotions
-            for emotion in EMOTIONS:
-                col_name = f"{emotion}_after"
-                if col_name in data.columns:
-                    ax.plot(
-                        data["turn"],
-                        data[col_name],
-                        label=emotion,
-                        color=EMOTION_COLORS.get(emotion, "#000000"),
-                        linewidth=1.5,
-                        alpha=0.7
-                    )
-
-            ax.set_title(pattern, fontsize=10, fontweight='bold')
-            ax.set_xlim(1, 30)
-            ax.set_ylim(0, 1)
-            ax.grid(True, alpha=0.2)
-
-            if col == 0:
-                ax.set_ylabel("Intensity", fontsize=9)
-            if row == 1:
-                ax.set_xlabel("Turn", fontsize=9)
-
-        plt.tight_layout()
-        output_path = PLOTS_DIR / f"comparison_grid_{strategy}.png"
-        plt.savefig(output_path, dpi=150, bbox_inches='tight')
-        plt.close()
-
-        print(f"  ✓ Saved {output_path.name}")
+    if groups is None:
+        _, groups = load_data_grouped()
+    patterns = sorted({pattern for pattern, _ in groups})
+    strategies = sorted({strategy for _, strategy in groups})
+
+    tasks = [
+        ([(pattern, groups.get((pattern, strategy))) for pattern in patterns],
+         strategy, PLOTS_DIR / f"comparison_grid_{strategy}.png")
+        for strategy in strategies
+    ]
+
+    # Only render grids whose inputs changed since they were last saved
+    data_key = input_digest()
+    pending = [task for task in tasks
+               if force or not up_to_date(task[2], f"{data_key}|{task[2].name}")]
+    if pending:
+        with _plot_pool(len(pending)) as pool:
+            pool.starmap(create_comparison_grid, pending)
+
+    rendered = {task[2] for task in pending}
+    for _, _, output_path in tasks:
+        if output_path in rendered:
+            mark_up_to_date(output_path, f"{data_key}|{output_path.name}")
+            print(f"  ✓ Saved {output_path.name}")
+        else:
+            print(f"  - {output_path.name} unchanged, skipped")
 
 if __name__ == "__main__":
-    generate_all_plots()
-    generate_comparison_grid()
+    parser = argparse.ArgumentParser(description="Generate emotional trajectory plots")
+    parser.add_argument("--force", action="store_true",
+                        help="regenerate plots even if their inputs are unchanged")
+    args = parser.parse_args()
+
+    _, groups = load_data_grouped()
+    generate_all_plots(groups, force=args.force)
+    generate_comparison_grid(groups, force=args.force)
 
     print("\n" + "="*60)
     print("NEXT STEPS:")
@@ -0,0 +1,29 @@
+"""
+Plotting helpers shared by analyze.py and plot_trajectories.py
+
+matplotlib is imported inside the functions that need it, so importing this
+module stays cheap for runs that never plot.
+"""
+
+def subplots(*args, **kwargs):
+    """plt.subplots with constrained layout, or tight_layout on matplotlib < 3.5"""
+    import matplotlib
+    import matplotlib.pyplot as plt
+
+    # __version_info__ only exists from 3.5, so parse __version__ instead
+    major, minor = (int(part) for part in matplotlib.__version__.split(".")[:2])
+    if (major, minor) >= (3, 5):
+        return plt.subplots(*args, layout="constrained", **kwargs)
+    fig, axes = plt.subplots(*args, **kwargs)
+    fig.set_tight_layout(True)
+    return fig, axes
+
+def up_to_date(output_path, key):
+    """True if output_path was last written for this cache key"""
+    sidecar = output_path.with_suffix(".sha")
+    return output_path.exists() and sidecar.exists() and sidecar.read_text() == key
+
+def mark_up_to_date(output_path, key):
+    """Record the cache key output_path was written for"""
+    if output_path.exists():
+        output_path.with_suffix(".sha").write_text(key)
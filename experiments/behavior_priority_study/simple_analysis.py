@@ -4,59 +4,93 @@ Simple analysis script without external dependencies
 Analyzes the behavior priority study results
 """
 
+import heapq
 import json
+import math
+from operator import itemgetter
 from pathlib import Path
 from collections import Counter
 
+try:
+    import orjson
+except ImportError:  # optional, falls back to the stdlib parser
+    orjson = None
+
+def load_json(path):
+    """Parse a JSON file, using orjson when it is installed"""
+    with open(path, 'rb') as f:
+        if orjson is not None:
+            return orjson.loads(f.read())
+        return json.load(f)
+
 def load_data():
     """Load experimental results"""
     results_dir = Path("experiments/behavior_priority_study/results")
 
-    with open(results_dir / "detailed_results.json") as f:
-        results = json.load(f)
-
-    with open(results_dir / "statistics.json") as f:
-        stats = json.load(f)
-
-    return results, stats
+    return load_json(results_dir / "detailed_results.json")
 
 def analyze_by_strategy(results):
-    """Group results by strategy"""
+    """Aggregate per-strategy counts in a single pass over the results"""
     strategies = {}
     for result in results:
         strategy = result['strategy']
         if strategy not in strategies:
-            strategies[strategy] = []
-        strategies[strategy].append(result)
+            strategies[strategy] = {
+                'total': 0,
+                'behaviors': Counter(),
+                'modifier_sum': 0,
+                'matches': 0,
+            }
+        summary = strategies[strategy]
+        summary['total'] += 1
+        summary['behaviors'][result['selected_behavior']] += 1
+        summary['modifier_sum'] += result['emotional_modifier']
+        if result['matches_expected']:
+            summary['matches'] += 1
     return strategies
 
+def compute_stats(strategies_data):
+    """Per-strategy statistics in the same shape as statistics.json"""
+    stats = []
+    for strategy, summary in strategies_data.items():
+        total = summary['total']
+        # Shannon entropy (bits), matching calculate_entropy in runner.rs
+        variety = -sum((count / total) * math.log2(count / total)
+                       for count in summary['behaviors'].values())
+        stats.append({
+            'strategy': strategy,
+            'total_interactions': total,
+            'behavior_counts': dict(summary['behaviors']),
+            'avg_priority_override': summary['modifier_sum'] / total,
+            'variety_score': variety,
+            'expected_match_rate': (summary['matches'] / total) * 100,
+        })
+    return stats
+
 def print_comparison_table(strategies_data):
     """Print comparison table"""
     print("\n" + "="*80)
     print("BEHAVIOR SELECTION COMPARISON")
     print("="*80)
 
-    for strategy, results in strategies_data.items():
+    for strategy, summary in strategies_data.items():
         print(f"\n{strategy.upper().replace('_', ' ')}")
         print("-" * 80)
 
-        # Count behaviors
-        behaviors = Counter(r['selected_behavior'] for r in results)
-        total = len(results)
+        total = summary['total']
 
         print(f"Total Interactions: {total}")
         print("\nBehavior Distribution:")
-        for behavior, count in behaviors.most_common():
+        for behavior, count in summary['behaviors'].most_common():
             pct = (count / total) * 100
             print(f"  {behavior:40} {count:3} ({pct:5.1f}%)")
 
         # Average emotional modifier
-        avg_modifier = sum(r['emotional_modifier'] for r in results) / len(results)
+        avg_modifier = summary['modifier_sum'] / total
         print(f"\nAvg Emotional Modifier: {avg_modifier:+.2f}")
 
         # Match rate
-        matches = sum(1 for r in results if r['matches_expected'])
-        match_rate = (matches / total) * 100
+        match_rate = (summary['matches'] / total) * 100
         print(f"Expected Match Rate: {match_rate:.1f}%")
 
 def analyze_scenarios(results):
@@ -65,24 +99,20 @@ def analyze_scenarios(results):
     print("SCENARIO ANALYSIS")
     print("="*80)
 
+    # Only the first few behaviors per scenario/strategy are printed,
+    # so keep just those names rather than every result
     scenarios = {}
     for result in results:
-        scenario = result['scenario']
-        if scenario not in scenarios:
-            scenarios[scenario] = {}
-
-        strategy = result['strategy']
-        if strategy not in scenarios[scenario]:
-            scenarios[scenario][strategy] = []
-        scenarios[scenario][strategy].append(result)
+        behaviors = scenarios.setdefault(result['scenario'], {}).setdefault(result['strategy'], [])
+        if len(behaviors) < 5:
+            behaviors.append(result['selected_behavior'])
 
     for scenario, strategies_data in scenarios.items():
         print(f"\n{scenario.upper().replace('_', ' ')}")
         print("-" * 80)
 
-        for strategy, results_list in strategies_data.items():
-            behaviors = [r['selected_behavior'] for r in results_list]
-            print(f"  {strategy:20} => {', '.join(behaviors[:5])}")
+        for strategy, behaviors in strategies_data.items():
+            print(f"  {strategy:20} => {', '.join(behaviors)}")
 
 def analyze_emotional_modifiers(results):
     """Analyze emotional priority modifiers"""
@@ -96,10 +126,11 @@ def analyze_emotional_modifiers(results):
         print("No emotion-modulated results found")
         return
 
-    print("\nLargest Priority Boosts (emotion_modulated):")
-    sorted_results = sorted(emotion_mod_results, key=lambda x: x['emotional_modifier'], reverse=True)
+    # Partial selection of the extremes instead of fully sorting twice
+    by_modifier = itemgetter('emotional_modifier')
 
-    for result in sorted_results[:10]:
+    print("\nLargest Priority Boosts (emotion_modulated):")
+    for result in heapq.nlargest(10, emotion_mod_results, key=by_modifier):
         if result['emotional_modifier'] > 0:
             print(f"  {result['scenario']:25} Step {result['step']:2}: "
                   f"{result['selected_behavior']:30} "
@@ -107,7 +138,7 @@ def analyze_emotional_modifiers(results):
                   f"(Emotion: {result['dominant_emotion']}/{result['dominant_value']:.2f})")
 
     print("\nLargest Priority Reductions (emotion_modulated):")
-    for result in sorted(emotion_mod_results, key=lambda x: x['emotional_modifier'])[:10]:
+    for result in heapq.nsmallest(10, emotion_mod_results, key=by_modifier):
         if result['emotional_modifier'] < 0:
             print(f"  {result['scenario']:25} Step {result['step']:2}: "
                   f"{result['selected_behavior']:30} "
@@ -118,37 +149,41 @@ def generate_text_report(results, stats):
     """Generate text report"""
     report_path = Path("experiments/behavior_priority_study/results/REPORT.txt")
 
-    with open(report_path, 'w') as f:
-        f.write("BEHAVIOR PRIORITY STUDY - RESULTS\n")
-        f.write("=" * 80 + "\n\n")
+    parts = [
+        "BEHAVIOR PRIORITY STUDY - RESULTS\n",
+        "=" * 80 + "\n\n",
+
+        "Overview\n",
+        "-" * 80 + "\n",
+        "This experiment compares emotion-modulated behavior selection against\n",
+        "traditional fixed-priority and random selection approaches.\n\n",
 
-        f.write("Overview\n")
-        f.write("-" * 80 + "\n")
-        f.write("This experiment compares emotion-modulated behavior selection against\n")
-        f.write("traditional fixed-priority and random selection approaches.\n\n")
+        "Key Findings\n",
+        "-" * 80 + "\n\n",
+    ]
 
-        f.write("Key Findings\n")
-        f.write("-" * 80 + "\n\n")
+    for stat in stats:
+        parts.append(f"{stat['strategy'].upper().replace('_', ' ')}\n")
+        parts.append(f"  Variety Score: {stat['variety_score']:.3f}\n")
+        parts.append(f"  Match Rate: {stat['expected_match_rate']:.1f}%\n")
+        parts.append(f"  Avg Priority Override: {stat['avg_priority_override']:.2f}\n\n")
 
-        for stat in stats:
-            f.write(f"{stat['strategy'].upper().replace('_', ' ')}\n")
-            f.write(f"  Variety Score: {stat['variety_score']:.3f}\n")
-            f.write(f"  Match Rate: {stat['expected_match_rate']:.1f}%\n")
-            f.write(f"  Avg Priority Override: {stat['avg_priority_override']:.2f}\n\n")
+    # Conclusions
+    emotion_mod = next(s for s in stats if s['strategy'] == 'emotion_modulated')
+    fixed = next(s for s in stats if s['strategy'] == 'fixed_priority')
 
-        # Conclusions
-        emotion_mod = next(s for s in stats if s['strategy'] == 'emotion_modulated')
-        fixed = next(s for s in stats if s['strategy'] == 'fixed_priority')
+    variety_diff = ((emotion_mod['variety_score'] - fixed['variety_score'])
+                   / fixed['variety_score'] * 100)
+    match_diff = emotion_mod['expected_match_rate'] - fixed['expected_match_rate']
 
-        variety_diff = ((emotion_mod['variety_score'] - fixed['variety_score'])
-                       / fixed['variety_score'] * 100)
-        match_diff = emotion_mod['expected_match_rate'] - fixed['expected_match_rate']
+    parts.append("Conclusions\n")
+    parts.append("-" * 80 + "\n")
+    parts.append(f"1. Variety Difference: {variety_diff:+.1f}%\n")
+    parts.append(f"2. Match Rate Difference: {match_diff:+.1f}%\n")
+    parts.append(f"3. Emotional Influence: {emotion_mod['avg_priority_override']:.2f} avg modifier\n")
 
-        f.write("Conclusions\n")
-        f.write("-" * 80 + "\n")
-        f.write(f"1. Variety Difference: {variety_diff:+.1f}%\n")
-        f.write(f"2. Match Rate Difference: {match_diff:+.1f}%\n")
-        f.write(f"3. Emotional Influence: {emotion_mod['avg_priority_override']:.2f} avg modifier\n")
+    # Single write of the assembled report
+    report_path.write_text(''.join(parts))
 
     print(f"\n✓ Saved text report to {report_path}")
 
@@ -159,11 +194,12 @@ def main():
 
     # Load data
     print("\nLoading data...")
-    results, stats = load_data()
+    results = load_data()
     print(f"✓ Loaded {len(results)} interactions")
 
-    # Group by strategy
+    # Group by strategy, deriving statistics from the same pass
     strategies_data = analyze_by_strategy(results)
+    stats = compute_stats(strategies_data)
 
     # Print comparisons
     print_comparison_table(strategies_data)